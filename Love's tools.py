@@ -4,16 +4,22 @@ bl_info = {
     "category": "Object",
     "version": (1, 0, 4),
     "author": "LoveD",
-    "description": "A collection of custom tools for various operations including origin transforms, material management, backdrops, lighting, face orientation toggle, scale checker, UV checker, and HDRI management.",
+    "description": "A collection of custom tools for various operations including origin transforms, material management, backdrops, lighting, preview renders, face orientation toggle, flipped normals checker, scale checker, UV checker, UV density analyzer, and HDRI management.",
 }
 
 import bpy
 import bmesh
 import math
+import numpy as np
 import random
-from mathutils import Vector
+from mathutils import Euler, Matrix, Vector
 import urllib.request
 import os
+import re
+import struct
+from collections import deque
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from bpy.props import StringProperty
 from bpy.types import Operator, Panel
 from bpy_extras.io_utils import ImportHelper
@@ -65,6 +71,8 @@ class OT_LoadHDRI(Operator, ImportHelper):
 
     def execute(self, context):
         file_path = self.filepath
+        if bpy.context.scene.world is None:
+            bpy.context.scene.world = bpy.data.worlds.new("World")
         bpy.context.scene.world.use_nodes = True
 
         # Clear existing nodes
@@ -340,6 +348,8 @@ def create_open_box(width, depth, height, angle, subsurf_level):
     else:
         obj.data.materials.append(material)
 
+    return obj
+
 def point_light_at_object(light, target_location):
     direction = target_location - light.location
     rot_quat = direction.to_track_quat('Z', 'Y')
@@ -414,6 +424,228 @@ class OBJECT_OT_CreateThreePointLighting(bpy.types.Operator):
             self.report({'WARNING'}, "No active object selected")
             return {'CANCELLED'}
 
+# Preview Render Operator
+def snapshot_settings(targets):
+    # Vectors, eulers and matrices are wrapped by reference, so they are copied to keep the original values
+    snapshot = []
+    for owner, attr in targets:
+        value = getattr(owner, attr)
+        snapshot.append((owner, attr, value.copy() if isinstance(value, (Euler, Matrix, Vector)) else value))
+    return snapshot
+
+def restore_settings(snapshot):
+    for owner, attr, value in reversed(snapshot):
+        setattr(owner, attr, value)
+
+def find_environment_node(world):
+    if world is None or not world.use_nodes:
+        return None
+    return next((node for node in world.node_tree.nodes if node.type == 'TEX_ENVIRONMENT' and node.image), None)
+
+def downscaled_hdri(image, scale):
+    preview = image.copy()
+    preview.name = f"{image.name}_preview"
+    preview.scale(max(1, int(image.size[0] * scale)), max(1, int(image.size[1] * scale)))
+    # Cycles reloads file images from disk, only packed pixels reach the render at the scaled size
+    preview.pack()
+    return preview
+
+def build_contact_sheet(file_paths, output_path):
+    images = [bpy.data.images.load(file_path) for file_path in file_paths]
+    width, height = images[0].size
+    columns = math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / columns)
+
+    sheet_pixels = np.zeros((rows * height, columns * width, 4), dtype=np.float32)
+    for i, image in enumerate(images):
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        # Pixel rows start at the bottom, so the first tile goes in the top row
+        y = (rows - 1 - i // columns) * height
+        x = (i % columns) * width
+        sheet_pixels[y:y + height, x:x + width] = pixels.reshape(height, width, 4)
+        bpy.data.images.remove(image)
+
+    sheet = bpy.data.images.new("ContactSheet", columns * width, rows * height, alpha=True)
+    sheet.pixels.foreach_set(sheet_pixels.ravel())
+    sheet.filepath_raw = output_path
+    sheet.file_format = 'PNG'
+    sheet.save()
+    bpy.data.images.remove(sheet)
+
+class OBJECT_OT_PreviewRender(bpy.types.Operator):
+    bl_idname = "object.preview_render"
+    bl_label = "Preview Render"
+    bl_description = "Build the backdrop and lighting stage, render a fast turntable or contact sheet and restore the production settings"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('TURNTABLE', "Turntable", "Render the active object from several angles"),
+            ('CONTACT_SHEET', "Contact Sheet", "Render every selected object in turn and tile them into one image"),
+        ],
+        default='TURNTABLE'
+    )
+    turntable_frames: bpy.props.IntProperty(name="Turntable Frames", default=8, min=1)
+    samples: bpy.props.IntProperty(name="Samples", default=32, min=1)
+    noise_threshold: bpy.props.FloatProperty(name="Noise Threshold", default=0.1, min=0.001)
+    resolution_percentage: bpy.props.IntProperty(name="Resolution %", default=50, min=1, max=100)
+    backdrop_subsurf_level: bpy.props.IntProperty(name="Backdrop Subdivision Level", default=1, min=0)
+    hdri_scale: bpy.props.FloatProperty(name="HDRI Scale", default=0.25, min=0.01, max=1.0)
+    transparent_background: bpy.props.BoolProperty(name="Transparent Background", default=False)
+    output_directory: bpy.props.StringProperty(name="Output Directory", default="//preview_renders/", subtype='DIR_PATH')
+
+    def execute(self, context):
+        scene = context.scene
+        target = context.active_object
+        if target is None or target.type != 'MESH':
+            self.report({'WARNING'}, "No active mesh object selected")
+            return {'CANCELLED'}
+        if scene.camera is None:
+            self.report({'WARNING'}, "Scene has no camera")
+            return {'CANCELLED'}
+
+        # Building the stage goes through object operators, which only run in Object Mode
+        edit_mode = target.mode == 'EDIT'
+        if edit_mode:
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        output_directory = bpy.path.abspath(self.output_directory)
+        os.makedirs(output_directory, exist_ok=True)
+
+        # Everything the preview profile touches, restored in reverse order once rendering is done.
+        # Colour depth and mode come before the file format so they are restored after it, PNG clamps them
+        targets = [
+            (scene, "world"),
+            (scene.render, "filepath"),
+            (scene.render, "resolution_percentage"),
+            (scene.render, "use_persistent_data"),
+            (scene.render, "film_transparent"),
+            (scene.render.image_settings, "color_depth"),
+            (scene.render.image_settings, "color_mode"),
+            (scene.render.image_settings, "file_format"),
+        ]
+        cycles = getattr(scene, "cycles", None)
+        if cycles is not None:
+            targets += [(cycles, "samples"), (cycles, "use_adaptive_sampling"), (cycles, "adaptive_threshold"), (cycles, "use_denoising")]
+        if hasattr(scene, "eevee"):
+            targets.append((scene.eevee, "taa_render_samples"))
+        snapshot = snapshot_settings(targets)
+
+        preview_world = None
+        preview_hdri = None
+        try:
+            backdrop = self.build_stage(context, target, selected_objects)
+            subjects = [obj for obj in selected_objects if obj != backdrop] or [target]
+
+            subsurf_modifiers = [modifier for modifier in backdrop.modifiers if modifier.type == 'SUBSURF']
+            for modifier in subsurf_modifiers:
+                snapshot += snapshot_settings([(modifier, "levels"), (modifier, "render_levels")])
+            if self.mode == 'CONTACT_SHEET':
+                for obj in subjects:
+                    snapshot += snapshot_settings([(obj, "location"), (obj, "hide_render")])
+
+            # The HDRI goes into a temporary world, loading it clears the node tree of the world it lands in
+            if find_environment_node(scene.world) is None and scene.hdri_filepath:
+                preview_world = bpy.data.worlds.new("PreviewWorld")
+                scene.world = preview_world
+                bpy.ops.wm.load_hdri(filepath=scene.hdri_filepath)
+            environment_node = find_environment_node(scene.world)
+            if environment_node is not None and self.hdri_scale < 1.0:
+                snapshot += snapshot_settings([(environment_node, "image")])
+                preview_hdri = downscaled_hdri(environment_node.image, self.hdri_scale)
+                environment_node.image = preview_hdri
+
+            scene.render.resolution_percentage = self.resolution_percentage
+            scene.render.use_persistent_data = True
+            scene.render.film_transparent = self.transparent_background
+            scene.render.image_settings.file_format = 'PNG'
+            if self.transparent_background:
+                scene.render.image_settings.color_mode = 'RGBA'
+            if cycles is not None:
+                cycles.samples = self.samples
+                cycles.use_adaptive_sampling = True
+                cycles.adaptive_threshold = self.noise_threshold
+                cycles.use_denoising = True
+            if hasattr(scene, "eevee"):
+                scene.eevee.taa_render_samples = self.samples
+            for modifier in subsurf_modifiers:
+                modifier.levels = min(modifier.levels, self.backdrop_subsurf_level)
+                modifier.render_levels = min(modifier.render_levels, self.backdrop_subsurf_level)
+
+            if self.mode == 'TURNTABLE':
+                rendered = self.render_turntable(scene, target, output_directory)
+            else:
+                rendered = self.render_contact_sheet(scene, target, subjects, output_directory)
+        finally:
+            restore_settings(snapshot)
+            if preview_hdri is not None:
+                bpy.data.images.remove(preview_hdri)
+            if preview_world is not None:
+                environment_node = find_environment_node(preview_world)
+                hdri = environment_node.image if environment_node else None
+                bpy.data.worlds.remove(preview_world)
+                if hdri is not None and hdri.users == 0:
+                    bpy.data.images.remove(hdri)
+            if edit_mode:
+                bpy.ops.object.mode_set(mode='EDIT')
+
+        self.report({'INFO'}, f"Preview render saved {rendered} to {output_directory}")
+        return {'FINISHED'}
+
+    def build_stage(self, context, target, selected_objects):
+        backdrop = bpy.data.objects.get("OpenBox")
+        if backdrop is None:
+            backdrop = create_open_box(4.0, 3.0, 3.0, 1.5708, 3)
+
+        if not any(obj.type == 'LIGHT' for obj in context.scene.objects):
+            create_three_point_lighting_around_object(target)
+
+        # Building the lights goes through selection operators, so the user's selection is put back
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in selected_objects:
+            obj.select_set(True)
+        context.view_layer.objects.active = target
+        return backdrop
+
+    def render_turntable(self, scene, target, output_directory):
+        # The object is spun through a temporary parent, so rotation mode and rotation animation don't matter
+        root = target
+        while root.parent is not None:
+            root = root.parent
+        pivot_location = target.matrix_world.translation.copy()
+        pivot = bpy.data.objects.new("TurntablePivot", None)
+        pivot.location = pivot_location
+        scene.collection.objects.link(pivot)
+        snapshot = snapshot_settings([(root, "parent"), (root, "matrix_parent_inverse")])
+        try:
+            root.parent = pivot
+            root.matrix_parent_inverse = Matrix.Translation(pivot_location).inverted()
+            for frame in range(self.turntable_frames):
+                pivot.rotation_euler.z = 2 * math.pi * frame / self.turntable_frames
+                scene.render.filepath = os.path.join(output_directory, f"turntable_{frame:03d}.png")
+                bpy.ops.render.render(write_still=True)
+        finally:
+            restore_settings(snapshot)
+            bpy.data.objects.remove(pivot)
+        return f"{self.turntable_frames} turntable frames"
+
+    def render_contact_sheet(self, scene, target, subjects, output_directory):
+        # Each subject is moved onto the stage spot of the active object and rendered alone
+        stage_location = target.location.copy()
+        file_paths = []
+        for obj in subjects:
+            for other in subjects:
+                other.hide_render = other != obj
+            obj.location = stage_location
+            scene.render.filepath = os.path.join(output_directory, f"sheet_{bpy.path.clean_name(obj.name)}.png")
+            bpy.ops.render.render(write_still=True)
+            file_paths.append(scene.render.filepath)
+        build_contact_sheet(file_paths, os.path.join(output_directory, "contact_sheet.png"))
+        return f"a contact sheet of {len(subjects)} objects"
+
 # Material Creator Operators
 class OBJECT_OT_CreateMaterials(bpy.types.Operator):
     bl_idname = "object.create_materials"
@@ -430,6 +662,17 @@ class OBJECT_OT_CreateMaterials(bpy.types.Operator):
         self.report({'INFO'}, "Materials created for selected objects")
         return {'FINISHED'}
 
+def strip_mesh_prefix(name):
+    # Check if the name starts with 'SM_'
+    if name.upper().startswith("SM_"):
+        # Remove 'SM_' prefix
+        return name[3:]
+    return name
+
+def prefixed_material_name(obj_name, prefix):
+    # Create new material name with the custom prefix
+    return f"{prefix}{strip_mesh_prefix(obj_name)}".replace("__", "_")
+
 class OBJECT_OT_CreateMaterialsPrefixed(bpy.types.Operator):
     bl_idname = "object.create_materials_prefixed"
     bl_label = "Create Materials with Prefix"
@@ -440,21 +683,266 @@ class OBJECT_OT_CreateMaterialsPrefixed(bpy.types.Operator):
         prefix = context.scene.custom_material_prefix
         for obj in selected_objects:
             if obj.type == 'MESH':
-                # Check if the object name starts with 'SM_'
-                if obj.name.upper().startswith("SM_"):
-                    # Remove 'SM_' prefix
-                    new_name = obj.name[3:]
-                else:
-                    new_name = obj.name
-
-                # Create new material name with the custom prefix
-                material_name = f"{prefix}{new_name}".replace("__", "_")
+                material_name = prefixed_material_name(obj.name, prefix)
                 mat = bpy.data.materials.new(name=material_name)
                 mat.use_nodes = True
                 obj.data.materials.append(mat)
         self.report({'INFO'}, f"Materials with prefix '{prefix}' created for selected objects")
         return {'FINISHED'}
 
+# Texture Set Material Builder
+TEXTURE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".tga", ".bmp", ".exr", ".hdr", ".tif", ".tiff"}
+TEXTURE_MAP_SUFFIXES = {
+    "BaseColor": ("basecolor", "base_color", "albedo", "diffuse", "color", "col"),
+    "Normal": ("normal", "normalgl", "nrm", "nor"),
+    "Roughness": ("roughness", "rough"),
+    "Metallic": ("metallic", "metalness", "metal"),
+    "Emission": ("emission", "emissive", "emission_color", "emissioncolor", "emissive_color"),
+    "Opacity": ("opacity", "alpha"),
+    "Height": ("height", "displacement", "disp"),
+}
+COLOR_TEXTURE_MAPS = {"BaseColor", "Emission"}
+# Longest suffixes first, so 'Emission_Color' is not taken for a 'Color' map
+TEXTURE_SUFFIX_ORDER = sorted(
+    ((suffix, map_type) for map_type, suffixes in TEXTURE_MAP_SUFFIXES.items() for suffix in suffixes),
+    key=lambda item: -len(item[0])
+)
+
+def split_texture_name(stem):
+    lowered = stem.lower()
+    for suffix, map_type in TEXTURE_SUFFIX_ORDER:
+        for separator in ("_", "-", ".", " "):
+            if lowered.endswith(separator + suffix):
+                return stem[:-len(suffix) - 1], map_type
+    return None, None
+
+def texture_set_key(name, prefix):
+    # Blender's duplicate suffix like '.001' is dropped so copies find the same texture set
+    name = re.sub(r"\.\d{3}$", "", name)
+    # Texture sets are named like the material, with or without 'T_', the custom prefix or 'SM_'
+    for strip in ("T_", prefix, "SM_"):
+        if strip and name.upper().startswith(strip.upper()):
+            name = name[len(strip):]
+    return name.replace("__", "_").lower()
+
+def build_texture_index(directory, prefix):
+    # Every candidate of a map is kept in sorted walk order, the best one is picked once probed
+    index = {}
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file_name in sorted(files):
+            stem, extension = os.path.splitext(file_name)
+            if extension.lower() not in TEXTURE_EXTENSIONS:
+                continue
+            set_name, map_type = split_texture_name(stem)
+            if map_type is None:
+                continue
+            index.setdefault(texture_set_key(set_name, prefix), {}).setdefault(map_type, []).append(os.path.join(root, file_name))
+    return index
+
+def pick_texture_set(candidates, probes):
+    # Highest resolution wins, ties keep the first file in walk order
+    texture_set = {}
+    for map_type, file_paths in candidates.items():
+        sizes = [probes[file_path][0] or (0, 0) for file_path in file_paths]
+        best = max(range(len(file_paths)), key=lambda i: (sizes[i][0] * sizes[i][1], -i))
+        texture_set[map_type] = file_paths[best]
+    return texture_set
+
+def read_jpeg_size(file):
+    file.seek(2)
+    while True:
+        marker = file.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+            continue
+        length = struct.unpack(">H", file.read(2))[0]
+        if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">xHH", file.read(5))
+            return width, height
+        file.seek(length - 2, os.SEEK_CUR)
+
+def read_null_terminated(file):
+    chars = []
+    while True:
+        char = file.read(1)
+        if char in (b"", b"\0"):
+            return b"".join(chars)
+        chars.append(char)
+
+def read_exr_size(file):
+    file.seek(8)
+    while True:
+        name = read_null_terminated(file)
+        if not name:
+            return None
+        read_null_terminated(file)
+        size = struct.unpack("<i", file.read(4))[0]
+        if name == b"dataWindow":
+            x_min, y_min, x_max, y_max = struct.unpack("<4i", file.read(16))
+            return x_max - x_min + 1, y_max - y_min + 1
+        file.seek(size, os.SEEK_CUR)
+
+def read_hdr_size(file):
+    for line in file.read(4096).split(b"\n")[1:]:
+        parts = line.split()
+        if len(parts) == 4 and parts[0] in (b"-Y", b"+Y"):
+            return int(parts[3]), int(parts[1])
+    return None
+
+def read_tiff_header(file, head):
+    # Width, height and sample format come from the tags of the first image directory
+    order = "<" if head.startswith(b"II") else ">"
+    file.seek(struct.unpack(order + "I", head[4:8])[0])
+    entry_count = struct.unpack(order + "H", file.read(2))[0]
+    tags = {}
+    for _ in range(entry_count):
+        tag, value_type, count, value = struct.unpack(order + "HHI4s", file.read(12))
+        if tag in (256, 257, 339):
+            # Short values sit in the first two bytes of the value field, long values fill it
+            tags[tag] = struct.unpack(order + ("H" if value_type == 3 else "I"), value[:2] if value_type == 3 else value)[0]
+            if tag == 339 and count > 1:
+                position = file.tell()
+                file.seek(tags[tag])
+                tags[tag] = struct.unpack(order + "H", file.read(2))[0]
+                file.seek(position)
+    size = (tags[256], tags[257]) if 256 in tags and 257 in tags else None
+    # Sample format 3 is IEEE floating point
+    return size, tags.get(339) == 3
+
+def probe_image_header(file_path):
+    # Only the first bytes of each file are read, the pixels are left to Blender
+    is_float = False
+    try:
+        with open(file_path, "rb") as file:
+            head = file.read(32)
+            if head.startswith(b"\x89PNG\r\n\x1a\n"):
+                size = struct.unpack(">II", head[16:24])
+            elif head.startswith(b"\xff\xd8"):
+                size = read_jpeg_size(file)
+            elif head.startswith(b"BM"):
+                width, height = struct.unpack("<ii", head[18:26])
+                size = (width, abs(height))
+            elif head.startswith(b"\x76\x2f\x31\x01"):
+                is_float = True
+                size = read_exr_size(file)
+            elif head.startswith(b"#?"):
+                is_float = True
+                file.seek(0)
+                size = read_hdr_size(file)
+            elif head.startswith((b"II*\0", b"MM\0*")):
+                size, is_float = read_tiff_header(file, head)
+            elif os.path.splitext(file_path)[1].lower() == ".tga":
+                size = struct.unpack("<HH", head[12:16])
+            else:
+                size = None
+    except (OSError, struct.error, ValueError) as e:
+        print(f"Failed to read image header of {file_path}: {e}")
+        size = None
+    return size, is_float
+
+def texture_colorspace(map_type, is_float):
+    if map_type not in COLOR_TEXTURE_MAPS:
+        return "Non-Color"
+    # Float images are already linear, Blender picks the right default for them
+    return None if is_float else "sRGB"
+
+def wire_texture_set(material, texture_set, probes):
+    nodes = material.node_tree.nodes
+    links = material.node_tree.links
+    bsdf = next((node for node in nodes if node.type == 'BSDF_PRINCIPLED'), None)
+    output = next((node for node in nodes if node.type == 'OUTPUT_MATERIAL'), None)
+    if bsdf is None or output is None:
+        return
+
+    for row, (map_type, file_path) in enumerate(sorted(texture_set.items())):
+        is_float = probes[file_path][1]
+        image = bpy.data.images.load(file_path, check_existing=True)
+        colorspace = texture_colorspace(map_type, is_float)
+        if colorspace:
+            image.colorspace_settings.name = colorspace
+
+        node_texture = nodes.new(type='ShaderNodeTexImage')
+        node_texture.image = image
+        node_texture.label = map_type
+        node_texture.location = (-700, 300 - row * 300)
+
+        if map_type == "Normal":
+            node_normal = nodes.new(type='ShaderNodeNormalMap')
+            node_normal.location = (-300, node_texture.location.y)
+            links.new(node_texture.outputs["Color"], node_normal.inputs["Color"])
+            links.new(node_normal.outputs["Normal"], bsdf.inputs["Normal"])
+        elif map_type == "Height":
+            node_displacement = nodes.new(type='ShaderNodeDisplacement')
+            node_displacement.location = (-300, node_texture.location.y)
+            links.new(node_texture.outputs["Color"], node_displacement.inputs["Height"])
+            links.new(node_displacement.outputs["Displacement"], output.inputs["Displacement"])
+        elif map_type == "Opacity":
+            links.new(node_texture.outputs["Color"], bsdf.inputs["Alpha"])
+            # EEVEE ignores alpha on opaque materials
+            if hasattr(material, "blend_method"):
+                material.blend_method = 'HASHED'
+        elif map_type == "Emission":
+            # Renamed to 'Emission Color' in Blender 4.0
+            emission_input = bsdf.inputs.get("Emission Color") or bsdf.inputs.get("Emission")
+            links.new(node_texture.outputs["Color"], emission_input)
+            # Emission Strength defaults to 0.0 since 4.0, which would hide the map
+            if emission_input.name == "Emission Color":
+                bsdf.inputs["Emission Strength"].default_value = 1.0
+        else:
+            input_name = "Base Color" if map_type == "BaseColor" else map_type
+            links.new(node_texture.outputs["Color"], bsdf.inputs[input_name])
+
+class OBJECT_OT_CreateTexturedMaterials(bpy.types.Operator):
+    bl_idname = "object.create_textured_materials"
+    bl_label = "Create Textured Materials with Prefix"
+    bl_description = "Create prefixed materials and wire in the matching texture set from the texture directory"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        directory = bpy.path.abspath(context.scene.texture_directory)
+        if not os.path.isdir(directory):
+            self.report({'WARNING'}, "Texture directory not found")
+            return {'CANCELLED'}
+
+        prefix = context.scene.custom_material_prefix
+        index = build_texture_index(directory, prefix)
+
+        matched = []
+        missing = []
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                candidates = index.get(texture_set_key(strip_mesh_prefix(obj.name), prefix))
+                if candidates:
+                    matched.append((obj, candidates))
+                else:
+                    missing.append(obj.name)
+
+        # Probe every matched file once, header reads are IO bound so threads overlap them
+        file_paths = sorted({file_path for _, candidates in matched for paths in candidates.values() for file_path in paths})
+        with ThreadPoolExecutor() as executor:
+            probes = dict(zip(file_paths, executor.map(probe_image_header, file_paths)))
+
+        mixed_resolution = []
+        for obj, candidates in matched:
+            texture_set = pick_texture_set(candidates, probes)
+            mat = bpy.data.materials.new(name=prefixed_material_name(obj.name, prefix))
+            mat.use_nodes = True
+            obj.data.materials.append(mat)
+            wire_texture_set(mat, texture_set, probes)
+
+            sizes = {probes[file_path][0] for file_path in texture_set.values()} - {None}
+            if len(sizes) > 1:
+                mixed_resolution.append(mat.name)
+
+        self.report({'INFO'}, f"Textured materials with prefix '{prefix}' created for {len(matched)} objects from {len(file_paths)} probed textures")
+        if mixed_resolution:
+            self.report({'WARNING'}, f"Texture sets with mixed resolutions: {', '.join(mixed_resolution)}")
+        if missing:
+            self.report({'WARNING'}, f"No texture set found for: {', '.join(missing)}")
+        return {'FINISHED'}
+
 # Face Orientation Toggle Operator
 class OBJECT_OT_ToggleFaceOrientation(bpy.types.Operator):
     bl_idname = "object.toggle_face_orientation"
@@ -467,6 +955,285 @@ class OBJECT_OT_ToggleFaceOrientation(bpy.types.Operator):
         
         return {'FINISHED'}
 
+# Mesh Array Helpers
+def face_loop_layout(mesh):
+    face_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+    loop_start = np.empty(face_count, dtype=np.int32)
+    loop_total = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+
+    # Owning face plus the next and previous loop of every loop, wrapping around each face
+    loop_faces = np.repeat(np.arange(face_count), loop_total)
+    next_loop = np.arange(1, loop_count + 1)
+    next_loop[loop_start + loop_total - 1] = loop_start
+    prev_loop = np.arange(-1, loop_count - 1)
+    prev_loop[loop_start] = loop_start + loop_total - 1
+    return loop_start, loop_total, loop_faces, next_loop, prev_loop
+
+# QA Result Cache
+QA_CACHE_PROPERTY = "loves_tools_qa_cache"
+
+# Every cached check hashes its own version tuple with the mesh data, bump it when the check changes
+def hash_arrays(*arrays):
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        # Shape goes into the hash too so arrays with the same bytes but different layout differ
+        digest.update(str(array.shape).encode())
+        digest.update(array.view(np.uint8))
+    return digest.hexdigest()
+
+def mesh_geometry_arrays(mesh):
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.vertices.foreach_get("co", coords)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    return coords, loop_verts, loop_start
+
+def get_cached_result(id_data, check, content_hash):
+    cache = id_data.get(QA_CACHE_PROPERTY)
+    entry = cache.get(check) if cache else None
+    if entry is None or entry.get("hash") != content_hash:
+        return None
+    return entry["result"].to_dict()
+
+def store_cached_result(id_data, check, content_hash, result):
+    if QA_CACHE_PROPERTY not in id_data:
+        id_data[QA_CACHE_PROPERTY] = {}
+    id_data[QA_CACHE_PROPERTY][check] = {"hash": content_hash, "result": result}
+
+class OBJECT_OT_ClearQACache(bpy.types.Operator):
+    bl_idname = "object.clear_qa_cache"
+    bl_label = "Clear QA Cache"
+    bl_description = "Remove the stored QA results so every check runs from scratch"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        cleared = 0
+        for id_data in list(bpy.data.meshes) + list(bpy.data.objects):
+            if QA_CACHE_PROPERTY in id_data:
+                del id_data[QA_CACHE_PROPERTY]
+                cleared += 1
+        self.report({'INFO'}, f"Cleared QA cache from {cleared} meshes and objects")
+        return {'FINISHED'}
+
+# Flipped Normals Checker
+FLIPPED_NORMALS_TOLERANCE = 0.01
+FLIPPED_NORMALS_CACHE_VERSION = (3, FLIPPED_NORMALS_TOLERANCE)
+
+def connected_face_labels(face_count, face_a, face_b):
+    # Label propagation with pointer jumping, every face ends up pointing at the lowest index of its component
+    labels = np.arange(face_count)
+    while True:
+        previous = labels.copy()
+        label_a = labels[face_a]
+        label_b = labels[face_b]
+        lowest = np.minimum(label_a, label_b)
+        np.minimum.at(labels, label_a, lowest)
+        np.minimum.at(labels, label_b, lowest)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        if np.array_equal(labels, previous):
+            return labels
+
+def find_flipped_faces(mesh):
+    face_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+    if face_count == 0:
+        return np.zeros(0, dtype=bool), 0
+
+    normals = np.empty(face_count * 3, dtype=np.float32)
+    centers = np.empty(face_count * 3, dtype=np.float32)
+    areas = np.empty(face_count, dtype=np.float32)
+    loop_verts = np.empty(loop_count, dtype=np.int32)
+    loop_edges = np.empty(loop_count, dtype=np.int32)
+    mesh.polygons.foreach_get("normal", normals)
+    mesh.polygons.foreach_get("center", centers)
+    mesh.polygons.foreach_get("area", areas)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    normals = normals.reshape(-1, 3).astype(np.float64)
+    centers = centers.reshape(-1, 3).astype(np.float64)
+    areas = areas.astype(np.float64)
+
+    # Direction each loop walks along its edge
+    _, _, loop_faces, next_loop, _ = face_loop_layout(mesh)
+    forward = loop_verts < loop_verts[next_loop]
+
+    # Pair up the two loops of every manifold edge, neighbours agree when they walk it in opposite directions
+    order = np.argsort(loop_edges, kind='stable')
+    counts = np.bincount(loop_edges, minlength=len(mesh.edges))
+    first = (np.cumsum(counts) - counts)[counts == 2]
+    loop_a = order[first]
+    loop_b = order[first + 1]
+    face_a = loop_faces[loop_a]
+    face_b = loop_faces[loop_b]
+    inconsistent = forward[loop_a] == forward[loop_b]
+
+    labels = connected_face_labels(face_count, face_a[~inconsistent], face_b[~inconsistent])
+    components = connected_face_labels(face_count, face_a, face_b)
+
+    # The largest consistently oriented region of each component is the reference, every other region
+    # is oriented against it by walking across the inconsistent edges between regions
+    region_area = np.bincount(labels, weights=areas, minlength=face_count)
+    regions = np.unique(labels)
+    by_size = regions[np.lexsort((-region_area[regions], components[regions]))]
+    dominant = by_size[np.unique(components[by_size], return_index=True)[1]]
+
+    conflicts = np.stack([labels[face_a[inconsistent]], labels[face_b[inconsistent]]], axis=1)
+    conflicts = np.unique(conflicts[conflicts[:, 0] != conflicts[:, 1]], axis=0)
+    region_parity = orient_regions(face_count, dominant, conflicts)
+    face_parity = region_parity[labels]
+
+    # Only components where every edge has exactly two faces enclose a volume
+    open_component = np.zeros(face_count, dtype=bool)
+    open_component[components[loop_faces[counts[loop_edges] != 2]]] = True
+
+    # Signed volume of each closed component with the regions oriented alike, around its own centroid
+    component_area = np.bincount(components, weights=areas, minlength=face_count)
+    centroids = np.stack([np.bincount(components, weights=centers[:, axis] * areas, minlength=face_count) for axis in range(3)], axis=1)
+    centroids /= np.maximum(component_area, 1e-12)[:, None]
+    volume = np.einsum('ij,ij->i', centers - centroids[components], normals) * areas
+    volume[face_parity] *= -1
+    component_volume = np.bincount(components, weights=volume, minlength=face_count)
+    component_scale = np.bincount(components, weights=np.abs(volume), minlength=face_count)
+    inside_out = ~open_component & (component_volume < -FLIPPED_NORMALS_TOLERANCE * component_scale)
+
+    return face_parity ^ inside_out[components], int(inconsistent.sum())
+
+def orient_regions(face_count, dominant, conflicts):
+    # Regions meeting across an inconsistent edge face opposite ways, parity True means against the reference
+    edges = np.concatenate((conflicts, conflicts[:, ::-1]))
+    edges = edges[np.argsort(edges[:, 0], kind='stable')]
+    starts = np.searchsorted(edges[:, 0], np.arange(face_count + 1))
+    neighbours = edges[:, 1].tolist()
+    starts = starts.tolist()
+
+    parity = np.zeros(face_count, dtype=bool)
+    visited = np.zeros(face_count, dtype=bool)
+    visited[dominant] = True
+    queue = deque(dominant.tolist())
+    while queue:
+        region = queue.popleft()
+        for neighbour in neighbours[starts[region]:starts[region + 1]]:
+            if not visited[neighbour]:
+                visited[neighbour] = True
+                parity[neighbour] = not parity[region]
+                queue.append(neighbour)
+    return parity
+
+def flip_faces(mesh, flags):
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.faces.ensure_lookup_table()
+    bmesh.ops.reverse_faces(bm, faces=[bm.faces[i] for i in np.flatnonzero(flags)])
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+def select_flagged_faces(mesh, flags):
+    # Vertices and edges follow the faces, otherwise Edit Mode keeps the old selection around them
+    loop_faces = face_loop_layout(mesh)[2]
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    selected_loops = flags[loop_faces]
+    vertex_select = np.zeros(len(mesh.vertices), dtype=bool)
+    edge_select = np.zeros(len(mesh.edges), dtype=bool)
+    vertex_select[loop_verts[selected_loops]] = True
+    edge_select[loop_edges[selected_loops]] = True
+    mesh.vertices.foreach_set("select", vertex_select)
+    mesh.edges.foreach_set("select", edge_select)
+    mesh.polygons.foreach_set("select", flags)
+    mesh.update()
+
+class MESH_OT_CheckFlippedNormals(bpy.types.Operator):
+    bl_idname = "mesh.check_flipped_normals"
+    bl_label = "Check Flipped Normals"
+    bl_description = "Find faces pointing into the mesh volume or against their neighbours, works without a viewport"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    select_faces: bpy.props.BoolProperty(name="Select Flipped Faces", default=True)
+    fix_normals: bpy.props.BoolProperty(name="Fix Flipped Faces", default=False)
+    use_cache: bpy.props.BoolProperty(name="Use Cached Results", default=True)
+
+    flipped_results = []
+
+    def execute(self, context):
+        self.flipped_results.clear()
+
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            objects = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+
+        edit_mode = context.object is not None and context.object.mode == 'EDIT'
+        if edit_mode:
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        checked_meshes = set()
+        for obj in objects:
+            mesh = obj.data
+            # Linked duplicates share a mesh, fixing it twice would flip the faces back
+            if mesh.name in checked_meshes:
+                continue
+            checked_meshes.add(mesh.name)
+
+            content_hash = hash_arrays(np.array(FLIPPED_NORMALS_CACHE_VERSION), *mesh_geometry_arrays(mesh))
+            cached = get_cached_result(mesh, "flipped_normals", content_hash) if self.use_cache else None
+            if cached is not None:
+                flags = np.zeros(len(mesh.polygons), dtype=bool)
+                flags[cached["flipped_faces"]] = True
+                inconsistent_edges = cached["inconsistent_edges"]
+            else:
+                flags, inconsistent_edges = find_flipped_faces(mesh)
+            flipped_count = int(flags.sum())
+
+            if self.fix_normals and flipped_count:
+                flip_faces(mesh, flags)
+            elif cached is None:
+                store_cached_result(mesh, "flipped_normals", content_hash, {
+                    "flipped_faces": np.flatnonzero(flags).tolist(),
+                    "inconsistent_edges": inconsistent_edges,
+                })
+            if self.select_faces:
+                select_flagged_faces(mesh, flags)
+
+            if flipped_count or inconsistent_edges:
+                self.flipped_results.append((obj.name, flipped_count, inconsistent_edges))
+
+        if edit_mode:
+            bpy.ops.object.mode_set(mode='EDIT')
+
+        if self.flipped_results:
+            action = "Fixed" if self.fix_normals else "Flipped"
+            summary = ", ".join(f"{name} ({count})" for name, count, _ in self.flipped_results)
+            self.report({'WARNING'}, f"{action} faces: {summary}")
+            if not bpy.app.background:
+                bpy.context.window_manager.popup_menu(self.draw_result, title="Normals Check", icon='ERROR')
+        else:
+            self.report({'INFO'}, f"All normals are consistent on {len(objects)} mesh objects.")
+            if not bpy.app.background:
+                bpy.context.window_manager.popup_menu(self.draw_result, title="Normals Check", icon='INFO')
+
+        return {'FINISHED'}
+
+    def draw_result(self, menu, context):
+        layout = menu.layout
+        if self.flipped_results:
+            layout.label(text="Flipped Faces:")
+            for obj_name, flipped_count, inconsistent_edges in self.flipped_results:
+                layout.label(text=f"{obj_name}: {flipped_count} faces, {inconsistent_edges} inconsistent edges")
+        else:
+            layout.label(text="Normals Status: Correct")
+
 # Scale Checker Operator
 class OBJECT_OT_CheckScale(bpy.types.Operator):
     bl_idname = "object.check_scale"
@@ -538,6 +1305,198 @@ class OBJECT_OT_ToggleUVChecker(bpy.types.Operator):
 
         return {'FINISHED'}
 
+# UV Density Analyzer
+UV_DENSITY_ATTRIBUTE = "UVDensity"
+UV_STRETCH_RATIO = 2.0
+UV_ANGLE_DISTORTION = math.radians(15)
+UV_DENSITY_TOLERANCE = 0.1
+UV_DENSITY_CACHE_VERSION = (1, UV_STRETCH_RATIO, UV_ANGLE_DISTORTION)
+
+def loop_corner_angles(points, next_loop, prev_loop):
+    to_next = points[next_loop] - points
+    to_prev = points[prev_loop] - points
+    lengths = np.linalg.norm(to_next, axis=1) * np.linalg.norm(to_prev, axis=1)
+    cosine = np.einsum('ij,ij->i', to_next, to_prev) / np.maximum(lengths, 1e-12)
+    return np.arccos(np.clip(cosine, -1.0, 1.0))
+
+def analyze_uv_density(obj, texture_resolution):
+    mesh = obj.data
+    face_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+    uv_layer = mesh.uv_layers.active
+    if face_count == 0 or uv_layer is None:
+        return None
+
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    loop_verts = np.empty(loop_count, dtype=np.int32)
+    uvs = np.empty(loop_count * 2, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    uv_layer.data.foreach_get("uv", uvs)
+
+    # World space positions so object scale counts towards texel density
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    coords = coords.reshape(-1, 3).astype(np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+    points = coords[loop_verts]
+    uvs = uvs.reshape(-1, 2).astype(np.float64)
+
+    loop_start, loop_total, loop_faces, next_loop, prev_loop = face_loop_layout(mesh)
+
+    # Shoelace areas summed per face
+    surface_area = 0.5 * np.linalg.norm(np.add.reduceat(np.cross(points, points[next_loop]), loop_start), axis=1)
+    uv_cross = uvs[:, 0] * uvs[next_loop, 1] - uvs[next_loop, 0] * uvs[:, 1]
+    uv_area = 0.5 * np.abs(np.add.reduceat(uv_cross, loop_start))
+
+    density = np.sqrt(uv_area / np.maximum(surface_area, 1e-12)) * texture_resolution
+
+    # Share of the UV layout against share of the surface, 1.0 means no area stretch
+    area_ratio = (uv_area / max(uv_area.sum(), 1e-12)) / np.maximum(surface_area / max(surface_area.sum(), 1e-12), 1e-12)
+
+    uv_points = np.column_stack((uvs, np.zeros(loop_count)))
+    angle_error = np.abs(loop_corner_angles(points, next_loop, prev_loop) - loop_corner_angles(uv_points, next_loop, prev_loop))
+    angle_distortion = np.add.reduceat(angle_error, loop_start) / loop_total
+
+    valid = surface_area > 1e-12
+    weights = surface_area[valid]
+    mean_density = float(np.average(density[valid], weights=weights)) if valid.any() else 0.0
+    stretched = valid & ((area_ratio > UV_STRETCH_RATIO) | (area_ratio < 1.0 / UV_STRETCH_RATIO) | (angle_distortion > UV_ANGLE_DISTORTION))
+
+    return {
+        "density": density,
+        "area_ratio": area_ratio,
+        "angle_distortion": angle_distortion,
+        "loop_faces": loop_faces,
+        "mean_density": mean_density,
+        "min_density": float(density[valid].min()) if valid.any() else 0.0,
+        "max_density": float(density[valid].max()) if valid.any() else 0.0,
+        "stretched_faces": int(stretched.sum()),
+    }
+
+def density_heatmap_colors(density, reference_density):
+    # Blue under the reference density, green on it, red above it, one texture size step saturates
+    colors = np.ones((len(density), 4), dtype=np.float32)
+    steps = np.clip(np.log2(np.maximum(density, 1e-12) / max(reference_density, 1e-12)), -1.0, 1.0)
+    colors[:, 0] = np.clip(steps, 0.0, 1.0)
+    colors[:, 1] = 1.0 - np.abs(steps)
+    colors[:, 2] = np.clip(-steps, 0.0, 1.0)
+    return colors
+
+def uv_density_hash(obj, texture_resolution):
+    mesh = obj.data
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get("uv", uvs)
+    matrix = np.array(obj.matrix_world, dtype=np.float32)
+    return hash_arrays(np.array(UV_DENSITY_CACHE_VERSION), *mesh_geometry_arrays(mesh), uvs, matrix, np.array([texture_resolution]))
+
+def has_density_heatmap(mesh):
+    if hasattr(mesh, "color_attributes"):
+        return UV_DENSITY_ATTRIBUTE in mesh.color_attributes
+    return UV_DENSITY_ATTRIBUTE in mesh.vertex_colors
+
+def write_density_heatmap(mesh, loop_colors):
+    if hasattr(mesh, "color_attributes"):
+        attribute = mesh.color_attributes.get(UV_DENSITY_ATTRIBUTE)
+        if attribute is not None and (attribute.domain != 'CORNER' or attribute.data_type != 'BYTE_COLOR'):
+            mesh.color_attributes.remove(attribute)
+            attribute = None
+        if attribute is None:
+            attribute = mesh.color_attributes.new(name=UV_DENSITY_ATTRIBUTE, type='BYTE_COLOR', domain='CORNER')
+        attribute.data.foreach_set("color", loop_colors.ravel())
+    else:
+        attribute = mesh.vertex_colors.get(UV_DENSITY_ATTRIBUTE) or mesh.vertex_colors.new(name=UV_DENSITY_ATTRIBUTE)
+        attribute.data.foreach_set("color", loop_colors.ravel())
+    mesh.update()
+
+class OBJECT_OT_AnalyzeUVDensity(bpy.types.Operator):
+    bl_idname = "object.analyze_uv_density"
+    bl_label = "Analyze UV Density"
+    bl_description = "Measure texel density and UV stretch of mesh objects and write a density heatmap color attribute"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    texture_resolution: bpy.props.IntProperty(name="Texture Resolution", default=2048, min=1)
+    target_density: bpy.props.FloatProperty(name="Target Density (px/m)", description="Heatmap reference, 0 uses the average of all checked objects", default=0.0, min=0.0)
+    write_heatmap: bpy.props.BoolProperty(name="Write Heatmap", default=True)
+    use_cache: bpy.props.BoolProperty(name="Use Cached Results", default=True)
+
+    density_results = []
+
+    def execute(self, context):
+        self.density_results.clear()
+
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            objects = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+
+        edit_mode = context.object is not None and context.object.mode == 'EDIT'
+        if edit_mode:
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        analyses = []
+        skipped = []
+        for obj in objects:
+            if obj.data.uv_layers.active is None or not obj.data.polygons:
+                skipped.append(obj.name)
+                continue
+            content_hash = uv_density_hash(obj, self.texture_resolution)
+            # Stored on the object, linked duplicates share a mesh but not a transform
+            cached = get_cached_result(obj, "uv_density", content_hash) if self.use_cache else None
+            analysis = cached if cached is not None else analyze_uv_density(obj, self.texture_resolution)
+            analyses.append([obj, content_hash, analysis, cached is not None])
+
+        if not analyses:
+            if edit_mode:
+                bpy.ops.object.mode_set(mode='EDIT')
+            self.report({'WARNING'}, "No mesh objects with UV maps to analyze")
+            return {'CANCELLED'}
+
+        reference_density = self.target_density or float(np.mean([analysis["mean_density"] for _, _, analysis, _ in analyses]))
+
+        painted_meshes = set()
+        for obj, content_hash, analysis, from_cache in analyses:
+            mesh = obj.data
+            # Linked duplicates share one heatmap, the first of them paints it. The heatmap stays valid
+            # while it was painted from the same object data against the same reference density
+            if self.write_heatmap and mesh.name not in painted_meshes:
+                painted_meshes.add(mesh.name)
+                heatmap = get_cached_result(mesh, "uv_density_heatmap", content_hash) if self.use_cache else None
+                if heatmap is None or heatmap["reference_density"] != reference_density or not has_density_heatmap(mesh):
+                    if from_cache:
+                        analysis = analyze_uv_density(obj, self.texture_resolution)
+                        from_cache = False
+                    face_colors = density_heatmap_colors(analysis["density"], reference_density)
+                    write_density_heatmap(mesh, face_colors[analysis["loop_faces"]])
+                    store_cached_result(mesh, "uv_density_heatmap", content_hash, {"reference_density": reference_density})
+            if not from_cache:
+                store_cached_result(obj, "uv_density", content_hash, {
+                    "mean_density": analysis["mean_density"],
+                    "min_density": analysis["min_density"],
+                    "max_density": analysis["max_density"],
+                    "stretched_faces": analysis["stretched_faces"],
+                })
+            deviation = (analysis["mean_density"] / reference_density - 1.0) * 100 if reference_density else 0.0
+            self.density_results.append((obj.name, analysis["mean_density"], analysis["min_density"], analysis["max_density"], deviation, analysis["stretched_faces"]))
+
+        if edit_mode:
+            bpy.ops.object.mode_set(mode='EDIT')
+
+        inconsistent = [name for name, _, _, _, deviation, stretched in self.density_results if abs(deviation) > UV_DENSITY_TOLERANCE * 100 or stretched]
+        if inconsistent:
+            self.report({'WARNING'}, f"Objects off the {reference_density:.1f} px/m texel density or with stretched UVs: {', '.join(inconsistent)}")
+        else:
+            self.report({'INFO'}, f"All {len(analyses)} objects are within {UV_DENSITY_TOLERANCE:.0%} of {reference_density:.1f} px/m with no stretched UVs.")
+        if skipped:
+            self.report({'INFO'}, f"Skipped objects without UV maps: {', '.join(skipped)}")
+        if not bpy.app.background:
+            bpy.context.window_manager.popup_menu(self.draw_result, title="UV Density", icon='ERROR' if inconsistent else 'INFO')
+
+        return {'FINISHED'}
+
+    def draw_result(self, menu, context):
+        layout = menu.layout
+        layout.label(text=f"Texel density at {self.texture_resolution}px:")
+        for obj_name, mean_density, min_density, max_density, deviation, stretched in self.density_results:
+            layout.label(text=f"{obj_name}: {mean_density:.1f} px/m ({min_density:.1f}-{max_density:.1f}), {deviation:+.0f}%, {stretched} stretched faces")
+
 # Check Unassigned Polygons Operator
 class MESH_OT_CheckUnassigned(bpy.types.Operator):
     bl_idname = "mesh.check_unassigned"
@@ -558,14 +1517,18 @@ class MESH_OT_CheckUnassigned(bpy.types.Operator):
             self.report({'INFO'}, "Mesh has no vertex groups")
             return {'FINISHED'}
 
-        # Create a set of vertices that are in vertex groups
-        vertices_in_groups = set()
-        for v in mesh.vertices:
-            if v.groups:
-                vertices_in_groups.add(v.index)
+        # Vertex group membership has no bulk accessor, so it is read in one pass over the vertices
+        vertices_in_groups = np.fromiter((bool(v.groups) for v in mesh.vertices), dtype=bool, count=len(mesh.vertices))
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        mesh.polygons.foreach_get("loop_start", loop_start)
 
-        # Check unassigned polygons
-        unassigned_faces = [f.index for f in mesh.polygons if all(vert not in vertices_in_groups for vert in f.vertices)]
+        # Check unassigned polygons, none of their vertices are in a vertex group
+        if len(loop_start):
+            unassigned_faces = np.flatnonzero(~np.logical_or.reduceat(vertices_in_groups[loop_verts], loop_start)).tolist()
+        else:
+            unassigned_faces = []
 
         if unassigned_faces:
             # Select unassigned polygons
@@ -649,6 +1612,11 @@ class OBJECT_PT_LovesTools(bpy.types.Panel):
         
         col.operator("object.create_three_point_lighting", text="Three-Point Lighting")
 
+        operator = col.operator("object.preview_render", text="Preview Turntable")
+        operator.mode = 'TURNTABLE'
+        operator = col.operator("object.preview_render", text="Preview Contact Sheet")
+        operator.mode = 'CONTACT_SHEET'
+
         layout.separator()
 
         # Material Creator Tools
@@ -659,6 +1627,10 @@ class OBJECT_PT_LovesTools(bpy.types.Panel):
         row.operator("object.create_materials_prefixed", text="Create Materials with Prefix")
         row = layout.row()
         row.prop(context.scene, "custom_material_prefix", text="Custom Prefix")
+        row = layout.row()
+        row.prop(context.scene, "texture_directory", text="Textures")
+        row = layout.row()
+        row.operator("object.create_textured_materials", text="Create Textured Materials with Prefix")
 
         layout.separator()
 
@@ -666,6 +1638,13 @@ class OBJECT_PT_LovesTools(bpy.types.Panel):
         row = layout.row()
         row.operator("object.toggle_face_orientation", text="Toggle Face Orientation")
 
+        # Flipped Normals Checker
+        row = layout.row()
+        row.operator("mesh.check_flipped_normals", text="Check Flipped Normals")
+        row = layout.row()
+        operator = row.operator("mesh.check_flipped_normals", text="Fix Flipped Normals")
+        operator.fix_normals = True
+
         # Scale Checker
         row = layout.row()
         row.operator("object.check_scale", text="Check Scale")
@@ -674,10 +1653,18 @@ class OBJECT_PT_LovesTools(bpy.types.Panel):
         row = layout.row()
         row.operator("object.toggle_uv_checker", text="Toggle UV Checker")
 
+        # UV Density Analyzer
+        row = layout.row()
+        row.operator("object.analyze_uv_density", text="Analyze UV Density")
+
         # Check Unassigned Polygons
         row = layout.row()
         row.operator("mesh.check_unassigned", text="Check Unassigned Polygons")
 
+        # QA Result Cache
+        row = layout.row()
+        row.operator("object.clear_qa_cache", text="Clear QA Cache")
+
         layout.separator()
         
         # HDRI and Transparency
@@ -716,12 +1703,17 @@ def register():
     bpy.utils.register_class(OBJECT_OT_DeleteAllMaterialsScene)
     bpy.utils.register_class(OBJECT_OT_CreateOpenBox)
     bpy.utils.register_class(OBJECT_OT_CreateThreePointLighting)
+    bpy.utils.register_class(OBJECT_OT_PreviewRender)
     bpy.utils.register_class(OBJECT_OT_CreateMaterials)
     bpy.utils.register_class(OBJECT_OT_CreateMaterialsPrefixed)
+    bpy.utils.register_class(OBJECT_OT_CreateTexturedMaterials)
     bpy.utils.register_class(OBJECT_OT_ToggleFaceOrientation)
+    bpy.utils.register_class(MESH_OT_CheckFlippedNormals)
     bpy.utils.register_class(OBJECT_OT_CheckScale)
     bpy.utils.register_class(OBJECT_OT_ToggleUVChecker)
+    bpy.utils.register_class(OBJECT_OT_AnalyzeUVDensity)
     bpy.utils.register_class(MESH_OT_CheckUnassigned)
+    bpy.utils.register_class(OBJECT_OT_ClearQACache)
     bpy.utils.register_class(OBJECT_OT_UpdateAddon)
     bpy.utils.register_class(OBJECT_PT_LovesTools)
     bpy.types.Scene.custom_material_prefix = bpy.props.StringProperty(
@@ -729,6 +1721,12 @@ def register():
         description="Prefix to add to material names",
         default="M_"
     )
+    bpy.types.Scene.texture_directory = StringProperty(
+        name="Texture Directory",
+        description="Directory scanned for texture sets named after the materials",
+        default="",
+        subtype='DIR_PATH'
+    )
     bpy.types.Scene.hdri_filepath = StringProperty(name="HDRI Filepath", default="")
 
 def unregister():
@@ -743,15 +1741,21 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_OT_DeleteAllMaterialsScene)
     bpy.utils.unregister_class(OBJECT_OT_CreateOpenBox)
     bpy.utils.unregister_class(OBJECT_OT_CreateThreePointLighting)
+    bpy.utils.unregister_class(OBJECT_OT_PreviewRender)
     bpy.utils.unregister_class(OBJECT_OT_CreateMaterials)
     bpy.utils.unregister_class(OBJECT_OT_CreateMaterialsPrefixed)
+    bpy.utils.unregister_class(OBJECT_OT_CreateTexturedMaterials)
     bpy.utils.unregister_class(OBJECT_OT_ToggleFaceOrientation)
+    bpy.utils.unregister_class(MESH_OT_CheckFlippedNormals)
     bpy.utils.unregister_class(OBJECT_OT_CheckScale)
     bpy.utils.unregister_class(OBJECT_OT_ToggleUVChecker)
+    bpy.utils.unregister_class(OBJECT_OT_AnalyzeUVDensity)
     bpy.utils.unregister_class(MESH_OT_CheckUnassigned)
+    bpy.utils.unregister_class(OBJECT_OT_ClearQACache)
     bpy.utils.unregister_class(OBJECT_OT_UpdateAddon)
     bpy.utils.unregister_class(OBJECT_PT_LovesTools)
     del bpy.types.Scene.custom_material_prefix
+    del bpy.types.Scene.texture_directory
     del bpy.types.Scene.hdri_filepath
 
 if __name__ == "__main__":